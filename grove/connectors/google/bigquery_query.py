@@ -3,24 +3,137 @@
 
 """Google BigQuery connector for Grove."""
 
+import hashlib
 import json
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone, date
-from typing import Any, Optional, Tuple, List, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import pyarrow
+import pyarrow.compute
+from google.api_core.exceptions import Unauthorized
 from google.auth.exceptions import GoogleAuthError
-from google.cloud import bigquery
+from google.cloud import bigquery, bigquery_storage
 from google.oauth2 import service_account
 
 from grove.connectors import BaseConnector
-from grove.connectors.google.utils import as_bigquery_timestamp_microseconds
 from grove.constants import CHRONOLOGICAL
 from grove.exceptions import (
     ConfigurationException,
+    GroveException,
     NotFoundException,
     RequestFailedException,
 )
 
+# Allowlists for values which are interpolated into generated SQL, rather than passed
+# as query parameters, as BigQuery does not support parameters for identifiers.
+PROJECT_ID_PATTERN = re.compile(r"^[A-Za-z0-9.:-]+$")
+DATASET_NAME_PATTERN = re.compile(r"^\w+$")
+TABLE_NAME_PATTERN = re.compile(r"^[\w-]+$")
+FIELD_PATH_PATTERN = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$")
+
+# Priorities which queries may be run with. Collection defaults to batch priority,
+# which does not count towards the concurrent interactive query quota.
+QUERY_PRIORITIES = {
+    "interactive": bigquery.QueryPriority.INTERACTIVE,
+    "batch": bigquery.QueryPriority.BATCH,
+}
+
+# The Unix epoch, used when converting TIMESTAMP values to microseconds.
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# BigQuery formats TIMESTAMP offsets as "+00", which datetime.fromisoformat does not
+# accept prior to Python 3.11.
+TIMESTAMP_OFFSET_PATTERN = re.compile(r"(:\d{2}(\.\d+)?[+-]\d{2})$")
+
+
+def _as_timestamp_pointer(epoch_usec: int) -> str:
+    """Formats a watermark as a timestamp pointer.
+
+    This matches the string form of TIMESTAMP values which BaseConnector.save() uses
+    for both the pointer and the keys of deduplication hashes.
+
+    :param epoch_usec: The watermark, in microseconds since the epoch.
+    :return: The timestamp at full microsecond precision, as str(datetime) would.
+    """
+    return str(EPOCH + timedelta(microseconds=epoch_usec))
+
+
+def _timestamp_to_usec(value: str) -> int:
+    """Parses a timestamp string into microseconds since the epoch.
+
+    :param value: An ISO 8601 timestamp, optionally with a BigQuery style offset.
+    :return: The timestamp, in microseconds since the epoch. Timestamps without an
+        offset are assumed to be UTC.
+    """
+    dt = datetime.fromisoformat(TIMESTAMP_OFFSET_PATTERN.sub(r"\1:00", value))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return (dt - EPOCH) // timedelta(microseconds=1)
+
+
+# Pointer predicates, and functions used to format the pointer for storage, for each
+# supported time_format. These are selected once per collection, rather than
+# branching on the time_format for every page.
+#
+# Pointers are inclusive of the watermark, so that log entries which share a pointer
+# with the last entry saved - but were cut off by the row limit - are collected on the
+# next run. Entries which were already saved are then discarded by hash based
+# deduplication, which requires the stored pointer to match the string form of the
+# pointer in saved log entries.
+POINTER_PREDICATES = {
+    "microseconds": (
+        "{pointer_path} >= @low_watermark AND {pointer_path} <= @ceiling_usec"
+    ),
+    "timestamp": (
+        "{pointer_path} >= TIMESTAMP_MICROS(@low_watermark) "
+        "AND {pointer_path} <= TIMESTAMP_MICROS(@ceiling_usec)"
+    ),
+}
+POINTER_FORMATTERS: Dict[str, Callable[[int], str]] = {
+    "microseconds": str,
+    "timestamp": _as_timestamp_pointer,
+}
+
+# Predicates used to prune partitions older than the lookback window, keyed by the
+# type of the partitioning column, as BigQuery will not compare a DATE parameter with
+# a DATETIME or TIMESTAMP column.
+PARTITION_PREDICATES = {
+    "DATE": "{partition_column} >= @min_partition_date",
+    "DATETIME": "{partition_column} >= DATETIME(@min_partition_date)",
+    "TIMESTAMP": "{partition_column} >= TIMESTAMP(@min_partition_date)",
+}
+
+# Types of the pseudo-columns of ingestion-time partitioned tables. Other partitioning
+# columns are assumed to be a TIMESTAMP unless their type is configured.
+PARTITION_COLUMN_TYPES = {
+    "_PARTITIONDATE": "DATE",
+    "_PARTITIONTIME": "TIMESTAMP",
+}
+
+# The query used to collect logs. Only identifiers are interpolated, as all values
+# are passed as query parameters.
+QUERY_TEMPLATE = """
+        SELECT {columns}
+        FROM `{project_id}.{dataset_name}.{table_name}`
+        WHERE {predicates}
+        ORDER BY {pointer_path} ASC
+        LIMIT @row_limit
+        """
+
+# BigQuery clients are cached between collections, keyed by project and identity, in
+# order to reuse their underlying connection pools rather than setting up new
+# connections and fetching new tokens for every run.
+_CLIENT_CACHE: Dict[Tuple[str, str], bigquery.Client] = {}
+_BQSTORAGE_CLIENT_CACHE: Dict[Tuple[str, str], bigquery_storage.BigQueryReadClient] = {}
+
+# Credentials are cached by a hash of the service account info they were built from,
+# allowing connectors which share a service account to share credentials.
+_CREDENTIALS_CACHE: Dict[str, service_account.Credentials] = {}
+
 
 class Connector(BaseConnector):
     CONNECTOR = "google_bigquery_query"
@@ -45,13 +158,26 @@ class Connector(BaseConnector):
             min_lookback_days = getattr(self.configuration, "min_lookback_days", 3)
             max_lookback_days = getattr(self.configuration, "max_lookback_days", 30)
             late_buffer_days = getattr(self.configuration, "late_buffer_days", 2)
+            use_storage_api = getattr(self.configuration, "use_storage_api", True)
+            query_priority = getattr(self.configuration, "query_priority", "batch")
+            # Reading over more than one stream requires the Storage Read API, and
+            # holds each query's entire result - up to max_query_rows - in memory so
+            # that it can be sorted before the first page is saved.
+            max_stream_count = getattr(self.configuration, "max_stream_count", 1)
+            partition_column = getattr(
+                self.configuration, "partition_column", "_PARTITIONDATE"
+            )
+            partition_column_type = getattr(
+                self.configuration, "partition_column_type", None
+            )
+            max_query_rows = getattr(self.configuration, "max_query_rows", 100000)
 
             self.logger.debug("Configuration parameters:")
-            self.logger.debug(f"Project ID: {project_id}")
-            self.logger.debug(f"Dataset Name: {dataset_name}")
-            self.logger.debug(f"Table Name: {table_name}")
-            self.logger.debug(f"Columns: {columns}")
-            self.logger.debug(f"Page Size: {page_size}")
+            self.logger.debug("Project ID: %s", project_id)
+            self.logger.debug("Dataset Name: %s", dataset_name)
+            self.logger.debug("Table Name: %s", table_name)
+            self.logger.debug("Columns: %s", columns)
+            self.logger.debug("Page Size: %s", page_size)
 
             if not self.POINTER_PATH:
                 raise ConfigurationException(
@@ -68,7 +194,7 @@ class Connector(BaseConnector):
             if not isinstance(columns, list):
                 raise ConfigurationException("columns must be a list.")
 
-            if time_format not in ["microseconds", "timestamp"]:
+            if time_format not in POINTER_PREDICATES:
                 raise ConfigurationException(
                     "time_format must be either 'microseconds' or 'timestamp'"
                 )
@@ -76,6 +202,67 @@ class Connector(BaseConnector):
             if not isinstance(page_size, int) or page_size <= 0:
                 raise ConfigurationException("page_size must be a positive integer.")
 
+            if not isinstance(max_query_rows, int) or max_query_rows <= 0:
+                raise ConfigurationException(
+                    "max_query_rows must be a positive integer."
+                )
+
+            if not isinstance(use_storage_api, bool):
+                raise ConfigurationException("use_storage_api must be a boolean.")
+
+            if not isinstance(max_stream_count, int) or max_stream_count <= 0:
+                raise ConfigurationException(
+                    "max_stream_count must be a positive integer."
+                )
+
+            if max_stream_count > 1 and not use_storage_api:
+                raise ConfigurationException(
+                    "max_stream_count greater than 1 requires use_storage_api."
+                )
+
+            if query_priority not in QUERY_PRIORITIES:
+                raise ConfigurationException(
+                    "query_priority must be either 'interactive' or 'batch'"
+                )
+
+            if not PROJECT_ID_PATTERN.match(project_id):
+                raise ConfigurationException(f"project_id '{project_id}' is not valid.")
+
+            if not DATASET_NAME_PATTERN.match(dataset_name):
+                raise ConfigurationException(
+                    f"dataset_name '{dataset_name}' is not valid."
+                )
+
+            if not TABLE_NAME_PATTERN.match(table_name):
+                raise ConfigurationException(f"table_name '{table_name}' is not valid.")
+
+            if not FIELD_PATH_PATTERN.match(self.POINTER_PATH):
+                raise ConfigurationException(
+                    f"pointer_path '{self.POINTER_PATH}' is not a valid field path."
+                )
+
+            if not isinstance(partition_column, str) or (
+                partition_column and not FIELD_PATH_PATTERN.match(partition_column)
+            ):
+                raise ConfigurationException(
+                    f"partition_column '{partition_column}' is not a valid field path."
+                )
+
+            if (
+                partition_column_type is not None
+                and partition_column_type not in PARTITION_PREDICATES
+            ):
+                raise ConfigurationException(
+                    "partition_column_type must be one of 'DATE', 'DATETIME' or "
+                    "'TIMESTAMP'"
+                )
+
+            for column in columns:
+                if column != "*" and not FIELD_PATH_PATTERN.match(str(column)):
+                    raise ConfigurationException(
+                        f"Column '{column}' must be '*' or a valid field path."
+                    )
+
         except AttributeError as err:
             raise ConfigurationException(
                 f"Missing required configuration attribute: {err}"
@@ -83,86 +270,203 @@ class Connector(BaseConnector):
 
         self.logger.info("BigQuery connector configured successfully.")
 
-        # Create BigQuery client with retry logic for auth deadlock
-        client = self._create_bigquery_client(project_id)
+        # Reuse a cached BigQuery client, or create one with retry logic for auth
+        # deadlock.
+        client = self._get_bigquery_client(project_id)
+
+        # Results are downloaded over the BigQuery Storage Read API as Arrow record
+        # batches where enabled, rather than paging through JSON via the REST API.
+        bqstorage_client = None
+        if use_storage_api:
+            bqstorage_client = self._get_bqstorage_client(project_id)
 
         # Initialize watermark and pointer
         last_seen_usec = self._initialize_watermark(time_format)
-        
-        # Configuration for batching
-        all_rows = []
+
+        # Each query is ordered by the pointer and limited to a number of whole pages.
+        # BigQuery writes the result to an anonymous destination table which is then
+        # read page by page, rather than filtering and sorting the source table again
+        # for every page. The rows returned by a single query are capped, as a large
+        # ordered result may exceed BigQuery's resources, so further queries are run
+        # from the last pointer read until max_batches pages have been collected. Each
+        # further query is submitted before the final page of the previous query is
+        # saved, overlapping its execution with the processing of that page.
+        pages_per_query = max(1, max_query_rows // page_size)
+        query = self._build_query(
+            project_id, dataset_name, table_name, columns, self.POINTER_PATH,
+            time_format, partition_column, partition_column_type
+        )
+        min_partition_date, ceiling_usec = self._compute_query_bounds(
+            last_seen_usec, bootstrap_days, min_lookback_days, max_lookback_days,
+            late_buffer_days
+        )
+        submit_args = {
+            "client": client,
+            "query": query,
+            "project_id": project_id,
+            "min_partition_date": min_partition_date,
+            "ceiling_usec": ceiling_usec,
+            "priority": QUERY_PRIORITIES[query_priority],
+        }
+
+        # The stored pointer is only rebuilt from the watermark when the watermark
+        # advances, rather than being formatted again for every page.
+        format_pointer = POINTER_FORMATTERS[time_format]
+        pointer = self.pointer
         batch_count = 0
 
-        while batch_count < max_batches:
-            # Compute adaptive lookback window
-            now_utc = datetime.now(timezone.utc)
-            lookback_days = self._compute_lookback_days(
-                last_seen_usec, now_utc, bootstrap_days, min_lookback_days, 
-                max_lookback_days, late_buffer_days
+        try:
+            row_limit = page_size * min(pages_per_query, max_batches)
+            query_watermark = last_seen_usec
+            query_job: Optional[bigquery.QueryJob] = self._submit_query(
+                **submit_args, last_seen_usec=query_watermark, row_limit=row_limit
             )
-            
-            # Calculate partition bounds
-            min_partition_date = (now_utc - timedelta(days=lookback_days)).date()
-            ceiling_usec = int((now_utc - timedelta(seconds=180)).timestamp() * 1_000_000)  # Fixed 3-minute lag
-            
-            self.logger.debug(f"Fetching batch {batch_count + 1}:")
-            self.logger.debug(f"  Lookback days: {lookback_days}")
-            self.logger.debug(f"  Min partition date: {min_partition_date}")
-            self.logger.debug(f"  Ceiling usec: {ceiling_usec}")
-            self.logger.debug(f"  Last seen usec: {last_seen_usec}")
 
-            # Fetch page with optimized query
-            try:
-                rows, new_last_seen_usec, debug_metadata = self._fetch_page_bigquery(
-                    client=client,
+            while query_job is not None:
+                next_query_job = None
+                next_query_watermark = None
+                next_row_limit = 0
+                rows_read = 0
+
+                for rows in self._read_pages(
+                    query_job=query_job,
                     project_id=project_id,
-                    dataset_name=dataset_name,
-                    table_name=table_name,
-                    columns=columns,
-                    pointer_path=self.POINTER_PATH,
-                    time_format=time_format,
-                    last_seen_usec=last_seen_usec,
                     page_size=page_size,
                     min_partition_date=min_partition_date,
-                    ceiling_usec=ceiling_usec
-                )
-                
-                if not rows:
-                    self.logger.info("No more logs found.")
-                    break
+                    ceiling_usec=ceiling_usec,
+                    bqstorage_client=bqstorage_client,
+                    max_stream_count=max_stream_count,
+                    pointer_path=self.POINTER_PATH,
+                ):
+                    batch_count += 1
+                    rows_read += len(rows)
+                    self.logger.info(
+                        "Collected %d logs in batch %d.", len(rows), batch_count
+                    )
+
+                    new_last_seen_usec = self._extract_watermark(
+                        rows[-1], self.POINTER_PATH, time_format, last_seen_usec
+                    )
+
+                    if new_last_seen_usec is None:
+                        new_last_seen_usec = last_seen_usec
+
+                    # A query which returned as many rows as its limit may have more
+                    # rows to collect.
+                    if rows_read == row_limit:
+                        # If every row returned shares the watermark the query started
+                        # from, including the watermark would only return the same rows
+                        # again, so the watermark is stepped past instead. Any further
+                        # rows sharing it cannot be paged through, so are skipped.
+                        if (
+                            new_last_seen_usec is not None
+                            and new_last_seen_usec == query_watermark
+                        ):
+                            self.logger.warning(
+                                "At least %d logs share the pointer %s, skipping any "
+                                "further logs with this pointer.",
+                                row_limit,
+                                format_pointer(new_last_seen_usec),
+                            )
+                            new_last_seen_usec += 1
+
+                        # The next query is submitted from the last row of the final
+                        # page before that page is saved, so that BigQuery runs it
+                        # while the page is being processed and written.
+                        if batch_count < max_batches:
+                            next_row_limit = page_size * min(
+                                pages_per_query, max_batches - batch_count
+                            )
+                            next_query_watermark = new_last_seen_usec
+                            next_query_job = self._submit_query(
+                                **submit_args,
+                                last_seen_usec=next_query_watermark,
+                                row_limit=next_row_limit,
+                            )
+
+                    # Save each page as it arrives, rather than holding every page in
+                    # memory until the end of the collection.
+                    self.logger.debug(
+                        "Saving %d logs from batch %d.", len(rows), batch_count
+                    )
+                    self.save(rows)
+
+                    # Only advance the pointer once the page has been saved, so that a
+                    # failed collection resumes from the last saved page.
+                    if (
+                        new_last_seen_usec is not None
+                        and new_last_seen_usec != last_seen_usec
+                    ):
+                        last_seen_usec = new_last_seen_usec
+                        pointer = format_pointer(last_seen_usec)
+
+                    if self.pointer != pointer:
+                        self.pointer = pointer
+
+                query_job, row_limit = next_query_job, next_row_limit
+                query_watermark = next_query_watermark
 
-                self.logger.info(
-                    f"Collected {len(rows)} logs in batch {batch_count + 1}. "
-                    f"Debug: {debug_metadata}"
-                )
-                
-                all_rows.extend(rows)
-                batch_count += 1
-                
-                # Update watermark
-                if new_last_seen_usec is not None:
-                    last_seen_usec = new_last_seen_usec
-                    # Update pointer for Grove's tracking
-                    if time_format == "microseconds":
-                        self.pointer = str(last_seen_usec)
-                    else:
-                        self.pointer = as_bigquery_timestamp_microseconds(last_seen_usec)
-                
-                # Check if we've reached the end (less than full page)
-                if len(rows) < page_size:
-                    self.logger.info("Reached end of available data.")
-                    break
-                    
-            except Exception as err:
-                self.logger.error(f"BigQuery query failed: {err}")
-                raise RequestFailedException(f"BigQuery query failed: {err}")
+        except Exception as err:
+            if isinstance(err, GroveException):
+                raise
 
-        # Save collected rows
-        if all_rows:
-            self.logger.debug(
-                f"Saving {len(all_rows)} total logs from {batch_count} batches."
-            )
-            self.save(all_rows)
+            self.logger.error(f"BigQuery query failed: {err}")
+            raise RequestFailedException(f"BigQuery query failed: {err}")
+
+        if batch_count == 0:
+            self.logger.info("No more logs found.")
+
+    def _get_bigquery_client(self, project_id: str) -> bigquery.Client:
+        """Return a cached BigQuery client for this project and identity, creating
+        one if not already cached.
+
+        :param project_id: The Google Cloud project to create the client for.
+
+        :return: A BigQuery client.
+        """
+        key = (project_id, self.identity)
+
+        if key not in _CLIENT_CACHE:
+            _CLIENT_CACHE[key] = self._create_bigquery_client(project_id)
+        else:
+            self.logger.debug("Reusing cached BigQuery client.")
+
+        return _CLIENT_CACHE[key]
+
+    def _get_bqstorage_client(
+        self, project_id: str
+    ) -> bigquery_storage.BigQueryReadClient:
+        """Return a cached BigQuery Storage Read API client for this project and
+        identity, creating one if not already cached.
+
+        :param project_id: The Google Cloud project the client is used with.
+
+        :return: A BigQuery Storage Read API client.
+        """
+        key = (project_id, self.identity)
+
+        if key not in _BQSTORAGE_CLIENT_CACHE:
+            _BQSTORAGE_CLIENT_CACHE[key] = self._create_bqstorage_client()
+        else:
+            self.logger.debug("Reusing cached BigQuery Storage Read API client.")
+
+        return _BQSTORAGE_CLIENT_CACHE[key]
+
+    def _evict_clients(self, project_id: str):
+        """Remove any cached clients for this project and identity, ensuring that
+        new clients - and credentials - are created on the next collection.
+
+        Evicted clients are not closed, as they are shared by all connectors with the
+        same project and identity, which may be using them concurrently in other
+        threads. Their connections are released once no longer referenced.
+
+        :param project_id: The Google Cloud project to evict clients for.
+        """
+        key = (project_id, self.identity)
+
+        _CREDENTIALS_CACHE.pop(self._credentials_cache_key(), None)
+        _BQSTORAGE_CLIENT_CACHE.pop(key, None)
+        _CLIENT_CACHE.pop(key, None)
 
     def _create_bigquery_client(self, project_id: str) -> bigquery.Client:
         """Create BigQuery client with retry logic for auth deadlock."""
@@ -193,12 +497,28 @@ class Connector(BaseConnector):
         # This should never be reached, but mypy requires it
         raise RuntimeError("Failed to create BigQuery client after all retry attempts")
 
+    def _create_bqstorage_client(self) -> bigquery_storage.BigQueryReadClient:
+        """Create a BigQuery Storage Read API client for downloading query results.
+
+        The gRPC transport is requested explicitly, so that result data is streamed
+        as Arrow over a single multiplexed HTTP/2 connection. The BigQuery client used
+        to run queries only supports REST, so this is where bulk data transfer occurs.
+
+        :return: A BigQuery Storage Read API client using the connector's credentials.
+        """
+        client = bigquery_storage.BigQueryReadClient(
+            credentials=self.get_credentials(), transport="grpc"
+        )
+        self.logger.debug("BigQuery Storage Read API client created successfully.")
+
+        return client
+
     def _initialize_watermark(self, time_format: str) -> Optional[int]:
         """Initialize the watermark from stored pointer or set default."""
         try:
             stored_pointer = self.pointer
             self.logger.debug(
-                f"Pointer found: {stored_pointer} ({type(stored_pointer)})"
+                "Pointer found: %s (%s)", stored_pointer, type(stored_pointer)
             )
 
             if stored_pointer and stored_pointer.strip():
@@ -211,28 +531,21 @@ class Connector(BaseConnector):
                         )
                 else:  # timestamp
                     try:
-                        dt = datetime.fromisoformat(stored_pointer.replace("+00", "+00:00"))
-                        return int(dt.timestamp() * 1_000_000)
+                        return _timestamp_to_usec(stored_pointer)
                     except ValueError:
                         raise ConfigurationException(
                             f"Pointer '{stored_pointer}' is not a valid timestamp format"
                         )
 
         except (NotFoundException, ValueError, ConfigurationException):
-            # Set to a week ago
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            week_ago = week_ago.replace(tzinfo=timezone.utc)
-            pointer_epoch_usec = int(week_ago.timestamp() * 1_000_000)
-            
+            # Set to a week before the start of this run.
+            week_ago = self._started - timedelta(days=7)
+            pointer_epoch_usec = (week_ago - EPOCH) // timedelta(microseconds=1)
+
             # Update pointer for Grove's tracking
-            if time_format == "microseconds":
-                self.pointer = str(pointer_epoch_usec)
-            else:
-                self.pointer = as_bigquery_timestamp_microseconds(pointer_epoch_usec)
+            self.pointer = POINTER_FORMATTERS[time_format](pointer_epoch_usec)
             
-            self.logger.debug(
-                f"No pointer found. Setting pointer to: {self.pointer}"
-            )
+            self.logger.debug("No pointer found. Setting pointer to: %s", self.pointer)
             return pointer_epoch_usec
         
         # This should never be reached, but mypy requires it
@@ -259,108 +572,354 @@ class Connector(BaseConnector):
         lookback_days = delta_days + late_buffer_days
         return max(min_days, min(max_days, int(lookback_days)))
 
-    def _fetch_page_bigquery(
+    def _compute_query_bounds(
+        self,
+        last_seen_usec: Optional[int],
+        bootstrap_days: int,
+        min_lookback_days: int,
+        max_lookback_days: int,
+        late_buffer_days: int,
+    ) -> Tuple[date, int]:
+        """Compute the partition and pointer bounds to use when querying for logs.
+
+        :return: Tuple of (min_partition_date, ceiling_usec)
+        """
+        # Compute adaptive lookback window, relative to the start of this run.
+        now_utc = self._started
+        lookback_days = self._compute_lookback_days(
+            last_seen_usec, now_utc, bootstrap_days, min_lookback_days, 
+            max_lookback_days, late_buffer_days
+        )
+        
+        # Calculate partition bounds
+        min_partition_date = (now_utc - timedelta(days=lookback_days)).date()
+        ceiling_usec = int((now_utc - timedelta(seconds=180)).timestamp() * 1_000_000)  # Fixed 3-minute lag
+        
+        self.logger.debug("Query bounds:")
+        self.logger.debug("  Lookback days: %s", lookback_days)
+        self.logger.debug("  Min partition date: %s", min_partition_date)
+        self.logger.debug("  Ceiling usec: %s", ceiling_usec)
+        self.logger.debug("  Last seen usec: %s", last_seen_usec)
+
+        return min_partition_date, ceiling_usec
+
+    def _build_query(
         self,
-        client: bigquery.Client,
         project_id: str,
         dataset_name: str,
         table_name: str,
         columns: List[str],
         pointer_path: str,
-        time_format: str,
+        time_format: str = "microseconds",
+        partition_column: str = "_PARTITIONDATE",
+        partition_column_type: Optional[str] = None,
+    ) -> str:
+        """
+        Build the parameterized query used to fetch logs after the last seen pointer.
+
+        The pointer is compared against the watermark parameters directly when it is
+        stored in microseconds, or after converting them with TIMESTAMP_MICROS when it
+        is a TIMESTAMP. Partitions before the lookback window are pruned using the
+        partition column, unless it is empty. The lookback bound is converted to the
+        type of the partition column, which is inferred for ingestion-time partitioning
+        pseudo-columns and otherwise defaults to TIMESTAMP.
+
+        Returns:
+            The query, which expects min_partition_date, low_watermark, ceiling_usec,
+            and row_limit query parameters.
+        """
+        predicates = []
+        if partition_column:
+            column_type = partition_column_type or PARTITION_COLUMN_TYPES.get(
+                partition_column, "TIMESTAMP"
+            )
+            partition_predicate = PARTITION_PREDICATES[column_type]
+            predicates.append(
+                partition_predicate.format(partition_column=partition_column)
+            )
+
+        predicates.append(
+            POINTER_PREDICATES[time_format].format(pointer_path=pointer_path)
+        )
+
+        query = QUERY_TEMPLATE.format(
+            columns=", ".join(columns),
+            project_id=project_id,
+            dataset_name=dataset_name,
+            table_name=table_name,
+            predicates="\n        AND ".join(predicates),
+            pointer_path=pointer_path,
+        )
+        self.logger.debug("Constructed query: %s", query)
+
+        return query
+
+    def _submit_query(
+        self,
+        client: bigquery.Client,
+        query: str,
+        project_id: str,
         last_seen_usec: Optional[int],
-        page_size: int,
+        row_limit: int,
         min_partition_date: date,
-        ceiling_usec: int
-    ) -> Tuple[List[Dict[str, Any]], Optional[int], Dict[str, Any]]:
+        ceiling_usec: int,
+        priority: str = bigquery.QueryPriority.BATCH,
+    ) -> bigquery.QueryJob:
         """
-        Fetch a page of data using optimized BigQuery query with partition pruning.
-        
+        Submit the query for logs, without waiting for it to complete.
+
         Returns:
-            Tuple of (rows, new_last_seen_usec, debug_metadata)
+            The submitted query job.
         """
         # Set low watermark for keyset pagination
         low_watermark = last_seen_usec if last_seen_usec is not None else -1
         
-        # Build query with parameters for better performance
-        query = f"""
-        SELECT {', '.join(columns)}
-        FROM `{project_id}.{dataset_name}.{table_name}`
-        WHERE _PARTITIONDATE >= @min_partition_date
-        AND {pointer_path} > @low_watermark
-        AND {pointer_path} <= @ceiling_usec
-        ORDER BY {pointer_path} ASC
-        LIMIT @page_size
-        """
-        
-        self.logger.debug(f"Constructed query: {query}")
-        
         # Set up query parameters
         query_params = [
             bigquery.ScalarQueryParameter("min_partition_date", "DATE", min_partition_date),
             bigquery.ScalarQueryParameter("low_watermark", "INT64", low_watermark),
             bigquery.ScalarQueryParameter("ceiling_usec", "INT64", ceiling_usec),
-            bigquery.ScalarQueryParameter("page_size", "INT64", page_size),
+            bigquery.ScalarQueryParameter("row_limit", "INT64", row_limit),
         ]
         
         # Configure query job
         job_config = bigquery.QueryJobConfig(
             query_parameters=query_params,
+            priority=priority,
             use_query_cache=False  # Disable cache for consistent results
         )
         
         try:
-            self.logger.info("Executing optimized BigQuery query.")
-            query_job = client.query(query, job_config=job_config)
-            results = query_job.result()
+            self.logger.info("Submitting optimized BigQuery query.")
+            return client.query(query, job_config=job_config)
+        except Exception as err:
+            raise self._query_failed(err, project_id)
+
+    def _read_pages(
+        self,
+        query_job: bigquery.QueryJob,
+        project_id: str,
+        page_size: int,
+        min_partition_date: date,
+        ceiling_usec: int,
+        bqstorage_client: Optional[bigquery_storage.BigQueryReadClient] = None,
+        max_stream_count: int = 1,
+        pointer_path: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Wait for a submitted query to complete, and read its result in pages.
+
+        If a BigQuery Storage Read API client is provided, results are downloaded as
+        Arrow record batches using this client rather than through the REST API. If
+        more than one stream is requested, the result is read over multiple streams
+        in parallel and then sorted by the pointer, as order is not preserved across
+        streams.
+
+        Returns:
+            An iterator of pages of rows, each containing at most page_size rows.
+        """
+        # Rows are held as Arrow record batches until a full page is available, and
+        # only that page is converted into log entries. This avoids holding a dict for
+        # every buffered row, and copying the remaining rows after each page.
+        buffered: List[pyarrow.RecordBatch] = []
+        buffered_rows = 0
+
+        try:
+            # Pages are only requested from the REST API when it is used to read the
+            # result. Otherwise the first page would be fetched as JSON and then
+            # discarded, as the result is downloaded again over the Storage Read API.
+            if bqstorage_client is None:
+                results = query_job.result(page_size=page_size)
+            else:
+                results = query_job.result()
             self.logger.debug("Query executed successfully.")
-            
-            rows = [dict(row) for row in results]
-            
-            # Extract new watermark from last row
-            new_last_seen_usec = None
-            if rows:
-                latest_row = rows[-1]
-                # Navigate to the timestamp field using the pointer path
-                timestamp_value: Any = latest_row
-                for part in pointer_path.split('.'):
-                    if isinstance(timestamp_value, dict):
-                        timestamp_value = timestamp_value.get(part, None)
-                    else:
-                        break
-                
-                if timestamp_value is not None:
-                    if time_format == "microseconds":
-                        new_last_seen_usec = int(timestamp_value)
-                    else:
-                        # Convert timestamp to microseconds if needed
-                        if isinstance(timestamp_value, (int, float)):
-                            new_last_seen_usec = int(timestamp_value * 1_000_000)
-                        else:
-                            # Assume it's already a timestamp string, convert to microseconds
-                            try:
-                                dt = datetime.fromisoformat(str(timestamp_value).replace("+00", "+00:00"))
-                                new_last_seen_usec = int(dt.timestamp() * 1_000_000)
-                            except ValueError:
-                                self.logger.warning(f"Could not parse timestamp value: {timestamp_value}")
-                                new_last_seen_usec = last_seen_usec
-            
-            # Build debug metadata
+
             debug_metadata = {
-                "lookback_days": (datetime.now(timezone.utc).date() - min_partition_date).days,
+                "lookback_days": (self._started.date() - min_partition_date).days,
                 "min_partition_date": str(min_partition_date),
                 "ceiling_usec": ceiling_usec,
-                "rows_returned": len(rows),
-                "new_watermark": new_last_seen_usec,
+                "rows_returned": getattr(results, 'total_rows', 'unknown'),
                 "bytes_processed": getattr(query_job, 'total_bytes_processed', 'unknown'),
                 "slot_ms": getattr(query_job, 'slot_millis', 'unknown')
             }
-            
-            return rows, new_last_seen_usec, debug_metadata
-            
+            self.logger.info("Query complete. Debug: %s", debug_metadata)
+
+            # Each page is decoded from Arrow into log entries in a single pass,
+            # rather than converting each row in Python. Without a BigQuery
+            # Storage Read API client the data is still paged through the REST API.
+            if bqstorage_client is not None and max_stream_count > 1 and pointer_path:
+                record_batches: Iterable[pyarrow.RecordBatch] = self._read_streams(
+                    query_job=query_job,
+                    project_id=project_id,
+                    bqstorage_client=bqstorage_client,
+                    max_stream_count=max_stream_count,
+                    pointer_path=pointer_path,
+                ).to_batches(max_chunksize=page_size)
+            else:
+                record_batches = results.to_arrow_iterable(
+                    bqstorage_client=bqstorage_client
+                )
+
+            for record_batch in record_batches:
+                buffered.append(record_batch)
+                buffered_rows += record_batch.num_rows
+
+                if buffered_rows < page_size:
+                    continue
+
+                table = pyarrow.Table.from_batches(buffered)
+                while table.num_rows >= page_size:
+                    yield table.slice(0, page_size).to_pylist()
+                    table = table.slice(page_size)
+
+                buffered = table.to_batches()
+                buffered_rows = table.num_rows
+
+            if buffered_rows:
+                yield pyarrow.Table.from_batches(buffered).to_pylist()
+
         except Exception as err:
-            self.logger.error(f"BigQuery query failed: {err}")
-            raise RequestFailedException(f"BigQuery query failed: {err}")
+            raise self._query_failed(err, project_id)
+
+    def _read_streams(
+        self,
+        query_job: bigquery.QueryJob,
+        project_id: str,
+        bqstorage_client: bigquery_storage.BigQueryReadClient,
+        max_stream_count: int,
+        pointer_path: str,
+    ) -> pyarrow.Table:
+        """
+        Read the destination table of a completed query over multiple BigQuery Storage
+        Read API streams in parallel.
+
+        As order is not preserved across streams, every stream is read into memory
+        and sorted before being returned. Peak memory is therefore proportional to the
+        number of rows returned by the query, rather than to the page size.
+
+        Returns:
+            The query result as an Arrow table, sorted by the pointer.
+        """
+        session = bqstorage_client.create_read_session(
+            parent=f"projects/{project_id}",
+            read_session=bigquery_storage.types.ReadSession(
+                table=query_job.destination.to_bqstorage(),
+                data_format=bigquery_storage.types.DataFormat.ARROW,
+            ),
+            max_stream_count=max_stream_count,
+        )
+        self.logger.debug("Reading query result over %d streams.", len(session.streams))
+
+        if not session.streams:
+            return pyarrow.table({})
+
+        with ThreadPoolExecutor(max_workers=len(session.streams)) as executor:
+            tables = list(
+                executor.map(
+                    lambda stream: bqstorage_client.read_rows(stream.name).to_arrow(
+                        session
+                    ),
+                    session.streams,
+                )
+            )
+
+        return self._sort_by_pointer(pyarrow.concat_tables(tables), pointer_path)
+
+    def _sort_by_pointer(self, table: pyarrow.Table, pointer_path: str) -> pyarrow.Table:
+        """
+        Sort an Arrow table by the pointer, which may be nested inside a struct column.
+
+        Returns:
+            The sorted table, or the table unchanged if it does not contain the pointer.
+        """
+        head, *tail = pointer_path.split(".")
+
+        key = None
+        if head in table.column_names:
+            key = table.column(head).combine_chunks()
+            for part in tail:
+                if (
+                    not pyarrow.types.is_struct(key.type)
+                    or key.type.get_field_index(part) < 0
+                ):
+                    key = None
+                    break
+
+                key = pyarrow.compute.struct_field(key, part)
+
+        if key is None:
+            self.logger.warning(
+                f"Pointer '{pointer_path}' not found in query result, unable to sort."
+            )
+            return table
+
+        return table.take(pyarrow.compute.sort_indices(key))
+
+    def _extract_watermark(
+        self,
+        row: Dict[str, Any],
+        pointer_path: str,
+        time_format: str,
+        last_seen_usec: Optional[int],
+    ) -> Optional[int]:
+        """
+        Extract the watermark, in microseconds, from the pointer of a row.
+
+        Returns:
+            The new watermark, or None if the row has no pointer value.
+        """
+        new_last_seen_usec = None
+
+        # Navigate to the timestamp field using the pointer path
+        timestamp_value: Any = row
+        for part in pointer_path.split('.'):
+            if isinstance(timestamp_value, dict):
+                timestamp_value = timestamp_value.get(part, None)
+            else:
+                break
+
+        if isinstance(timestamp_value, datetime):
+            # Arrow preserves TIMESTAMP columns as timezone aware datetimes.
+            new_last_seen_usec = (timestamp_value - EPOCH) // timedelta(
+                microseconds=1
+            )
+        elif timestamp_value is not None:
+            if time_format == "microseconds":
+                new_last_seen_usec = int(timestamp_value)
+            else:
+                # Convert timestamp to microseconds if needed
+                if isinstance(timestamp_value, (int, float)):
+                    new_last_seen_usec = int(timestamp_value * 1_000_000)
+                else:
+                    # Assume it's already a timestamp string, convert to microseconds
+                    try:
+                        new_last_seen_usec = _timestamp_to_usec(str(timestamp_value))
+                    except ValueError:
+                        self.logger.warning(f"Could not parse timestamp value: {timestamp_value}")
+                        new_last_seen_usec = last_seen_usec
+
+        return new_last_seen_usec
+
+    def _query_failed(
+        self, err: Exception, project_id: str
+    ) -> RequestFailedException:
+        """Log a failed BigQuery request, and discard any cached clients if the
+        failure was due to their credentials.
+
+        :param err: The exception raised by the failed request.
+        :param project_id: The Google Cloud project the request was made against.
+
+        :return: An exception to be raised by the caller.
+        """
+        # Don't hold on to clients whose credentials are no longer valid. A 403 is
+        # not treated as a credential failure, as BigQuery also returns one when rate
+        # limited, over quota, or denied access to a single table - none of which
+        # should affect other connectors sharing these clients.
+        if isinstance(err, (GoogleAuthError, Unauthorized)):
+            self._evict_clients(project_id)
+
+        self.logger.error(f"BigQuery query failed: {err}")
+        return RequestFailedException(f"BigQuery query failed: {err}")
 
     def get_credentials(self):
         """Generates and returns a credentials instance from the connector's configured
@@ -372,6 +931,10 @@ class Connector(BaseConnector):
         :raises ConfigurationException: There is an issue with the configuration
             for this connector.
         """
+        cache_key = self._credentials_cache_key()
+        if cache_key in _CREDENTIALS_CACHE:
+            return _CREDENTIALS_CACHE[cache_key]
+
         try:
             service_account_info = json.loads(self.key)
         except json.JSONDecodeError as err:
@@ -395,4 +958,13 @@ class Connector(BaseConnector):
                 f"Unable to generate credentials from service account info for {self.identity}: {err}"
             )
 
+        _CREDENTIALS_CACHE[cache_key] = credentials
+
         return credentials
+
+    def _credentials_cache_key(self) -> str:
+        """Return the key used to cache credentials for the configured service account.
+
+        :return: A SHA256 digest of the connector's service account info.
+        """
+        return hashlib.sha256(self.key.encode()).hexdigest()
@@ -8,12 +8,35 @@ import unittest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
+import pyarrow
+from google.api_core.exceptions import Forbidden, PermissionDenied, Unauthorized
+from google.cloud import bigquery
+
+from grove.connectors.google import bigquery_query
 from grove.connectors.google.bigquery_query import Connector
 from grove.models import ConnectorConfig
-from grove.exceptions import ConfigurationException, RequestFailedException
+from grove.exceptions import (
+    AccessException,
+    ConfigurationException,
+    RequestFailedException,
+)
 from tests import mocks
 
 
+def mock_row_iterator(rows, batch_size=1000):
+    """Returns a mock BigQuery RowIterator which yields the provided rows as Arrow
+    record batches.
+    """
+    results = Mock()
+    results.total_rows = len(rows)
+    results.to_arrow_iterable.return_value = [
+        pyarrow.RecordBatch.from_pylist(rows[i : i + batch_size])
+        for i in range(0, len(rows), batch_size)
+    ]
+
+    return results
+
+
 class GoogleBigQueryQueryTestCase(unittest.TestCase):
     """Implements unit tests for the Google BigQuery Query connector."""
 
@@ -46,6 +69,18 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
             },
         )
 
+        # Never construct a real BigQuery Storage Read API client.
+        patcher = patch(
+            "grove.connectors.google.bigquery_query.bigquery_storage.BigQueryReadClient"
+        )
+        self.mock_bqstorage_client = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Ensure clients are not reused between tests.
+        bigquery_query._CLIENT_CACHE.clear()
+        bigquery_query._BQSTORAGE_CLIENT_CACHE.clear()
+        bigquery_query._CREDENTIALS_CACHE.clear()
+
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
     def test_collect_no_pagination(self, mock_get_creds, mock_bigquery_client):
@@ -65,7 +100,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
             {"timestamp_usec": 1738500089504000, "message": "Test log 1", "user_id": "user1"},
             {"timestamp_usec": 1738500089505000, "message": "Test log 2", "user_id": "user2"},
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Set initial pointer
         self.connector._pointer = "1738500089504000"
@@ -91,12 +126,10 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         mock_query_job = Mock()
         mock_client.query.return_value = mock_query_job
         
-        # First call returns 5000 rows (triggers pagination)
-        # Second call returns 500 rows (ends pagination)
-        mock_rows_5000 = [{"timestamp_usec": i, "message": f"Log {i}"} for i in range(5000)]
-        mock_rows_500 = [{"timestamp_usec": i + 5000, "message": f"Log {i + 5000}"} for i in range(500)]
-        
-        mock_query_job.result.side_effect = [mock_rows_5000, mock_rows_500]
+        # A single query returns 5500 rows, which are read as two pages: 5000 rows
+        # (a full page) followed by 500 rows.
+        mock_rows = [{"timestamp_usec": i, "message": f"Log {i}"} for i in range(5500)]
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Set initial pointer
         self.connector._pointer = "1000000000000000"
@@ -105,13 +138,313 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         self.connector.configuration.max_batches = 2
         
         # Run collection
-        self.connector.run()
+        with patch.object(
+            self.connector, "save", wraps=self.connector.save
+        ) as mock_save:
+            self.connector.run()
         
-        # Verify pagination occurred (query called twice)
-        self.assertEqual(mock_client.query.call_count, 2)
+        # Verify pagination occurred over the result of a single query.
+        self.assertEqual(mock_client.query.call_count, 1)
+        self.assertEqual(mock_save.call_count, 2)
         # Total logs saved: 5000 + 500 = 5500
         self.assertEqual(self.connector._saved["logs"], 5500)
 
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_limits_rows_to_max_batches(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure a single query is limited to max_batches pages of rows."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+        mock_query_job.result.return_value = mock_row_iterator(
+            [{"timestamp_usec": i} for i in range(1, 5)]
+        )
+
+        self.connector._pointer = "0"
+        self.connector.configuration.page_size = 2
+        self.connector.configuration.max_batches = 2
+        self.connector.run()
+
+        self.assertEqual(mock_client.query.call_count, 1)
+        self.assertEqual(self.connector._saved["logs"], 4)
+        self.assertEqual(self.connector._pointer, "4")
+
+        # The result is limited to max_batches pages, and downloaded over the Storage
+        # Read API rather than fetching a first page of rows from the REST API.
+        mock_query_job.result.assert_called_once_with()
+        job_config = mock_client.query.call_args.kwargs["job_config"]
+        params = {p.name: p.value for p in job_config.query_parameters}
+        self.assertEqual(params["low_watermark"], 0)
+        self.assertEqual(params["row_limit"], 4)
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_saves_each_page(self, mock_get_creds, mock_bigquery_client):
+        """Ensure each page is saved as it is collected."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+
+        # Record batches are not aligned with pages, so must be split into pages.
+        mock_query_job.result.return_value = mock_row_iterator(
+            [{"timestamp_usec": i} for i in range(1, 6)], batch_size=3
+        )
+
+        self.connector._pointer = "0"
+        self.connector.configuration.page_size = 2
+        self.connector.configuration.max_batches = 3
+
+        with patch.object(
+            self.connector, "save", wraps=self.connector.save
+        ) as mock_save:
+            self.connector.run()
+
+        self.assertEqual(
+            [len(call.args[0]) for call in mock_save.call_args_list], [2, 2, 1]
+        )
+        self.assertEqual(self.connector._saved["logs"], 5)
+        self.assertEqual(self.connector._pointer, "5")
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_caps_rows_per_query(self, mock_get_creds, mock_bigquery_client):
+        """Ensure further queries are run when max_query_rows is exceeded."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        first_job = Mock()
+        first_job.result.return_value = mock_row_iterator(
+            [{"timestamp_usec": i} for i in range(1, 5)]
+        )
+        second_job = Mock()
+        second_job.result.return_value = mock_row_iterator(
+            [{"timestamp_usec": i} for i in range(5, 7)]
+        )
+        mock_client.query.side_effect = [first_job, second_job]
+
+        self.connector._pointer = "0"
+        self.connector.configuration.page_size = 2
+        self.connector.configuration.max_batches = 3
+        self.connector.configuration.max_query_rows = 5
+
+        # Record how many queries had been submitted when each page was saved.
+        queries_at_save = []
+        save = self.connector.save
+
+        def record_save(rows):
+            queries_at_save.append(mock_client.query.call_count)
+            save(rows)
+
+        with patch.object(self.connector, "save", side_effect=record_save):
+            self.connector.run()
+
+        # The second query is submitted before the final page of the first query is
+        # saved, rather than after.
+        self.assertEqual(queries_at_save, [1, 2, 2])
+
+        # Queries are limited to whole pages, and the second query only fetches the
+        # remaining page from the last pointer read.
+        params = [
+            {
+                p.name: p.value
+                for p in call.kwargs["job_config"].query_parameters
+            }
+            for call in mock_client.query.call_args_list
+        ]
+        self.assertEqual([p["row_limit"] for p in params], [4, 2])
+        self.assertEqual([p["low_watermark"] for p in params], [0, 4])
+        self.assertEqual(self.connector._saved["logs"], 6)
+        self.assertEqual(self.connector._pointer, "6")
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_deduplicates_boundary_rows(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure rows sharing the pointer of the last saved row are not saved twice."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+
+        # The first collection is cut off by the row limit part way through the rows
+        # with a pointer of 2.
+        mock_query_job.result.return_value = mock_row_iterator(
+            [
+                {"timestamp_usec": 1, "message": "a"},
+                {"timestamp_usec": 2, "message": "b"},
+            ]
+        )
+        self.connector._pointer = "0"
+        self.connector.run()
+
+        self.assertEqual(self.connector._saved["logs"], 2)
+        self.assertEqual(self.connector._pointer, "2")
+
+        # The next collection includes the watermark, so the last row saved is read
+        # again alongside the remaining rows which share its pointer.
+        mock_query_job.result.return_value = mock_row_iterator(
+            [
+                {"timestamp_usec": 2, "message": "b"},
+                {"timestamp_usec": 2, "message": "c"},
+                {"timestamp_usec": 3, "message": "d"},
+            ]
+        )
+        self.connector.run()
+
+        self.assertEqual(self.connector._saved["logs"], 4)
+        self.assertEqual(self.connector._pointer, "3")
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_steps_past_watermark_shared_by_full_query(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure collection does not stall when a full query only returns rows which
+        share the watermark it started from."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        tied_job = Mock()
+        tied_job.result.return_value = mock_row_iterator(
+            [
+                {"timestamp_usec": 5, "message": "a"},
+                {"timestamp_usec": 5, "message": "b"},
+            ]
+        )
+        next_job = Mock()
+        next_job.result.return_value = mock_row_iterator(
+            [{"timestamp_usec": 7, "message": "c"}]
+        )
+        mock_client.query.side_effect = [tied_job, next_job]
+
+        self.connector._pointer = "5"
+        self.connector.configuration.page_size = 2
+        self.connector.configuration.max_batches = 2
+        self.connector.configuration.max_query_rows = 2
+
+        with self.assertLogs(level="WARNING") as logs:
+            self.connector.run()
+
+        self.assertTrue(any("share the pointer 5" in line for line in logs.output))
+
+        # The next query starts after the shared watermark, rather than from it.
+        params = [
+            {p.name: p.value for p in call.kwargs["job_config"].query_parameters}
+            for call in mock_client.query.call_args_list
+        ]
+        self.assertEqual([p["low_watermark"] for p in params], [5, 6])
+        self.assertEqual(self.connector._saved["logs"], 3)
+        self.assertEqual(self.connector._pointer, "7")
+
+        # When no batches remain, the stepped watermark is stored as the pointer so
+        # that the next collection does not read the same rows again.
+        mock_client.query.side_effect = None
+        mock_client.query.return_value = tied_job
+        self.connector._pointer = "5"
+        self.connector.configuration.max_batches = 1
+        self.connector.run()
+
+        self.assertEqual(self.connector._pointer, "6")
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_timestamp_deduplicates_across_runs(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure a TIMESTAMP pointer row re-read by a later run is not saved again."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+
+        # The watermark is inclusive, so every run reads the last row saved again.
+        created_at = datetime.now(timezone.utc).replace(microsecond=700000) - timedelta(
+            hours=1
+        )
+        mock_query_job.result.return_value = mock_row_iterator(
+            [{"created_at": created_at, "message": "Test log 1"}]
+        )
+
+        self.connector.configuration.pointer_path = "created_at"
+        self.connector.configuration.columns = ["*"]
+        self.connector.configuration.time_format = "timestamp"
+
+        # Each collection uses a new connector, sharing only the cache, as with
+        # separate runs of Grove.
+        saved = 0
+        for _ in range(3):
+            with patch("grove.helpers.plugin.load_handler", mocks.load_handler):
+                connector = Connector(
+                    config=self.connector.configuration,
+                    context=self.connector.runtime_context,
+                )
+
+            connector._cache = self.connector._cache
+            connector.run()
+            saved += connector._saved["logs"]
+
+            # The pointer is stored at full precision, and parsed by the next run.
+            self.assertEqual(connector.pointer, str(created_at))
+
+        self.assertEqual(saved, 1)
+
+        params = {
+            p.name: p.value
+            for p in mock_client.query.call_args.kwargs["job_config"].query_parameters
+        }
+        self.assertEqual(
+            params["low_watermark"],
+            (created_at - bigquery_query.EPOCH) // timedelta(microseconds=1),
+        )
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_save_failure(self, mock_get_creds, mock_bigquery_client):
+        """Ensure a failed save stops collection and keeps the pointer."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+        mock_query_job.result.return_value = mock_row_iterator(
+            [{"timestamp_usec": i} for i in range(1, 5)]
+        )
+
+        self.connector._pointer = "0"
+        self.connector.configuration.page_size = 2
+        self.connector.configuration.max_batches = 3
+
+        with patch.object(
+            self.connector, "save", side_effect=AccessException("failed")
+        ) as mock_save:
+            self.connector.run()
+
+        mock_save.assert_called_once()
+        self.assertEqual(self.connector._pointer, "0")
+
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
     def test_collect_without_max_batches(self, mock_get_creds, mock_bigquery_client):
@@ -131,7 +464,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
             {"timestamp_usec": 1738500089504000, "message": "Test log 1", "user_id": "user1"},
             {"timestamp_usec": 1738500089505000, "message": "Test log 2", "user_id": "user2"},
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Create connector WITHOUT max_batches in config
         connector_without_max_batches = Connector(
@@ -186,7 +519,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
             {"created_at": "2025-01-01 10:01:00", "message": "Test log 2", "user_id": "user2"},
             {"created_at": "2025-01-01 10:02:00", "message": "Test log 3", "user_id": "user3"},
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Adjust self.connector's configuration for this test
         self.connector.configuration.pointer_path = "created_at"
@@ -216,8 +549,8 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         # Check that the query includes ORDER BY for the pointer path
         self.assertIn("ORDER BY created_at", call_args)
         
-        # Check that the query includes LIMIT for pagination (now uses @page_size parameter)
-        self.assertIn("LIMIT @page_size", call_args)
+        # Check that the query includes LIMIT for pagination (now uses @row_limit parameter)
+        self.assertIn("LIMIT @row_limit", call_args)
 
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
@@ -238,7 +571,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
             {"created_at": "2025-01-01 11:00:00", "message": "Test log 4", "user_id": "user4"},
             {"created_at": "2025-01-01 11:01:00", "message": "Test log 5", "user_id": "user5"},
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Adjust self.connector's configuration for this test
         self.connector.configuration.pointer_path = "created_at"
@@ -263,7 +596,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         call_args = mock_client.query.call_args[0][0]
         
         # Check that the query includes the timestamp comparison (now uses @low_watermark parameter)
-        self.assertIn("created_at > @low_watermark", call_args)
+        self.assertIn("created_at >= TIMESTAMP_MICROS(@low_watermark)", call_args)
         
         # Check that the query includes ORDER BY for the pointer path
         self.assertIn("ORDER BY created_at", call_args)
@@ -283,7 +616,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         mock_client.query.return_value = mock_query_job
         
         # Mock empty query results (no more data after default pointer)
-        mock_query_job.result.return_value = []
+        mock_query_job.result.return_value = mock_row_iterator([])
         
         # Test 1: Invalid microseconds pointer (non-integer) - should fall back to default
         self.connector.configuration.time_format = "microseconds"
@@ -297,7 +630,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         call_args = mock_client.query.call_args[0][0]
         
         # Should contain a valid microseconds value (7 days ago) - now uses @low_watermark parameter
-        self.assertIn("timestamp_usec > @low_watermark", call_args)
+        self.assertIn("timestamp_usec >= @low_watermark", call_args)
         
         # Reset for next test
         mock_client.reset_mock()
@@ -315,7 +648,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         call_args = mock_client.query.call_args[0][0]
         
         # Should contain a valid timestamp value (7 days ago) - now uses @low_watermark parameter
-        self.assertIn("created_at > @low_watermark", call_args)
+        self.assertIn("created_at >= TIMESTAMP_MICROS(@low_watermark)", call_args)
 
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
@@ -332,7 +665,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         mock_client.query.return_value = mock_query_job
         
         # Mock empty query results
-        mock_query_job.result.return_value = []
+        mock_query_job.result.return_value = mock_row_iterator([])
         
         # Set initial pointer
         self.connector._pointer = "1738500089504000"
@@ -354,7 +687,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         self.assertIn("test_dataset.test_table", call_args)
         
         # Check that the query includes the pointer comparison (now uses @low_watermark parameter)
-        self.assertIn("timestamp_usec > @low_watermark", call_args)
+        self.assertIn("timestamp_usec >= @low_watermark", call_args)
 
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
@@ -389,7 +722,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
                 }
             }
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Configure connector for nested JSON structure
         self.connector.configuration.pointer_path = "gmail.event_info.timestamp_usec"
@@ -408,7 +741,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         call_args = mock_client.query.call_args[0][0]
         
         # Check that the query uses the nested path correctly (now uses @low_watermark parameter)
-        self.assertIn("gmail.event_info.timestamp_usec > @low_watermark", call_args)
+        self.assertIn("gmail.event_info.timestamp_usec >= @low_watermark", call_args)
         self.assertIn("ORDER BY gmail.event_info.timestamp_usec", call_args)
 
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
@@ -435,7 +768,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
                 }
             }
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Configure connector to match the bug scenario
         self.connector.configuration.pointer_path = "gmail.event_info.timestamp_usec"
@@ -456,7 +789,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         self.connector.run()
         
         # Verify the query uses numeric comparison (correct)
-        self.assertIn("gmail.event_info.timestamp_usec > @low_watermark", captured_query)
+        self.assertIn("gmail.event_info.timestamp_usec >= @low_watermark", captured_query)
         
         # Verify it does NOT use TIMESTAMP function (which would cause syntax error)
         self.assertNotIn("TIMESTAMP(", captured_query)
@@ -468,7 +801,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         self.assertIn("SELECT gmail", captured_query)
         self.assertIn("FROM `test-project.test_dataset.test_table`", captured_query)
         self.assertIn("ORDER BY gmail.event_info.timestamp_usec ASC", captured_query)
-        self.assertIn("LIMIT @page_size", captured_query)
+        self.assertIn("LIMIT @row_limit", captured_query)
 
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
@@ -494,7 +827,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
                 }
             }
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Configure connector for timestamp format
         self.connector.configuration.pointer_path = "gmail.event_info.timestamp_usec"
@@ -515,13 +848,16 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         self.connector.run()
         
         # Verify the query uses TIMESTAMP function (correct for timestamp format)
-        self.assertIn("gmail.event_info.timestamp_usec > @low_watermark", captured_query)
+        self.assertIn(
+            "gmail.event_info.timestamp_usec >= TIMESTAMP_MICROS(@low_watermark)",
+            captured_query,
+        )
         
         # Verify the query is syntactically correct for BigQuery
         self.assertIn("SELECT gmail", captured_query)
         self.assertIn("FROM `test-project.test_dataset.test_table`", captured_query)
         self.assertIn("ORDER BY gmail.event_info.timestamp_usec ASC", captured_query)
-        self.assertIn("LIMIT @page_size", captured_query)
+        self.assertIn("LIMIT @row_limit", captured_query)
 
     @patch('grove.connectors.google.bigquery_query.bigquery.Client')
     @patch.object(Connector, 'get_credentials')
@@ -554,7 +890,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
                 }
             }
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Configure connector
         self.connector.configuration.pointer_path = "gmail.event_info.timestamp_usec"
@@ -596,7 +932,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
                 }
             }
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Configure connector to match the exact bug scenario from logs
         self.connector.configuration.pointer_path = "gmail.event_info.timestamp_usec"
@@ -618,7 +954,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         
         # This test would have caught the bug by verifying:
         # 1. The query uses numeric comparison (not timestamp string)
-        self.assertIn("gmail.event_info.timestamp_usec > @low_watermark", captured_query)
+        self.assertIn("gmail.event_info.timestamp_usec >= @low_watermark", captured_query)
         
         # 2. The query does NOT contain timestamp strings (which caused the syntax error)
         self.assertNotIn("2025-07-15 15:52:04+00", captured_query)
@@ -650,7 +986,7 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         mock_rows = [
             {"timestamp_usec": 1738500089504000, "message": "Test log 1"}
         ]
-        mock_query_job.result.return_value = mock_rows
+        mock_query_job.result.return_value = mock_row_iterator(mock_rows)
         
         # Set initial pointer
         self.connector._pointer = "1738500089504000"
@@ -664,6 +1000,333 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         # Verify that BigQuery client was attempted twice (retry logic)
         self.assertEqual(mock_bigquery_client.call_count, 2)
 
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_storage_api(self, mock_get_creds, mock_bigquery_client):
+        """Ensure results are downloaded using the BigQuery Storage Read API."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+
+        mock_rows = [
+            {"timestamp_usec": 1738500089504000, "message": "Test log 1"},
+            {"timestamp_usec": 1738500089505000, "message": "Test log 2"},
+        ]
+        results = mock_row_iterator(mock_rows)
+        mock_query_job.result.return_value = results
+
+        self.connector._pointer = "1738500089504000"
+        self.connector.run()
+
+        self.assertEqual(self.connector._saved["logs"], 2)
+        self.mock_bqstorage_client.assert_called_once_with(
+            credentials=mock_get_creds.return_value, transport="grpc"
+        )
+        results.to_arrow_iterable.assert_called_once_with(
+            bqstorage_client=self.mock_bqstorage_client.return_value
+        )
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_storage_api_disabled(self, mock_get_creds, mock_bigquery_client):
+        """Ensure results are downloaded via the REST API when Storage API is disabled."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+
+        mock_rows = [
+            {"timestamp_usec": 1738500089504000, "message": "Test log 1"},
+        ]
+        results = mock_row_iterator(mock_rows)
+        mock_query_job.result.return_value = results
+
+        self.connector.configuration.use_storage_api = False
+        self.connector._pointer = "1738500089504000"
+        self.connector.run()
+
+        self.assertEqual(self.connector._saved["logs"], 1)
+        self.mock_bqstorage_client.assert_not_called()
+        results.to_arrow_iterable.assert_called_once_with(bqstorage_client=None)
+        mock_query_job.result.assert_called_once_with(page_size=5000)
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_storage_api_multiple_streams(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure results read over multiple streams are saved in pointer order."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_query_job.destination = bigquery.TableReference.from_string(
+            "test-project._anonymous.result"
+        )
+        mock_client.query.return_value = mock_query_job
+
+        results = mock_row_iterator([])
+        results.total_rows = 4
+        mock_query_job.result.return_value = results
+
+        # Each stream returns its own slice of the result, in no particular order.
+        streams = {
+            "stream-1": pyarrow.table(
+                {"timestamp_usec": [1738500089506000, 1738500089504000]}
+            ),
+            "stream-2": pyarrow.table(
+                {"timestamp_usec": [1738500089507000, 1738500089505000]}
+            ),
+        }
+        session = Mock()
+        session.streams = [Mock(), Mock()]
+        session.streams[0].name = "stream-1"
+        session.streams[1].name = "stream-2"
+
+        mock_read_client = self.mock_bqstorage_client.return_value
+        mock_read_client.create_read_session.return_value = session
+        mock_read_client.read_rows.side_effect = lambda name: Mock(
+            **{"to_arrow.return_value": streams[name]}
+        )
+
+        self.connector.configuration.max_stream_count = 2
+        self.connector._pointer = "1738500089503000"
+
+        with patch.object(Connector, "save", autospec=True) as mock_save:
+            self.connector.run()
+
+        saved = [row["timestamp_usec"] for row in mock_save.call_args[0][1]]
+        self.assertEqual(
+            saved,
+            [1738500089504000, 1738500089505000, 1738500089506000, 1738500089507000],
+        )
+
+        kwargs = mock_read_client.create_read_session.call_args.kwargs
+        self.assertEqual(kwargs["parent"], "projects/test-project")
+        self.assertEqual(kwargs["max_stream_count"], 2)
+        self.assertEqual(
+            kwargs["read_session"].table,
+            "projects/test-project/datasets/_anonymous/tables/result",
+        )
+        results.to_arrow_iterable.assert_not_called()
+
+    def test_sort_by_pointer_nested_pointer_path(self):
+        """Test sorting an Arrow table by a pointer nested inside a struct column."""
+        table = pyarrow.table(
+            {
+                "gmail": [
+                    {"event_info": {"timestamp_usec": 3}},
+                    {"event_info": {"timestamp_usec": 1}},
+                    {"event_info": {"timestamp_usec": 2}},
+                ]
+            }
+        )
+
+        result = self.connector._sort_by_pointer(
+            table, "gmail.event_info.timestamp_usec"
+        )
+
+        self.assertEqual(
+            [row["gmail"]["event_info"]["timestamp_usec"] for row in result.to_pylist()],
+            [1, 2, 3],
+        )
+
+        # Tables without the pointer are returned unchanged.
+        self.assertIs(self.connector._sort_by_pointer(table, "gmail.missing"), table)
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_reuses_clients(self, mock_get_creds, mock_bigquery_client):
+        """Ensure BigQuery clients are reused between collections."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+        mock_query_job.result.return_value = mock_row_iterator([])
+
+        self.connector._pointer = "1738500089504000"
+        self.connector.run()
+        self.connector.run()
+
+        self.assertEqual(mock_client.query.call_count, 2)
+        self.assertEqual(mock_bigquery_client.call_count, 1)
+        self.assertEqual(self.mock_bqstorage_client.call_count, 1)
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_evicts_clients_on_auth_error(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure cached BigQuery clients are discarded after an auth error."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        mock_client.query.side_effect = Unauthorized("token expired")
+
+        self.connector._pointer = "1738500089504000"
+        self.connector.run()
+
+        # Evicted clients may still be in use by other connectors, so aren't closed.
+        mock_client.close.assert_not_called()
+        self.mock_bqstorage_client.return_value.transport.close.assert_not_called()
+        self.assertEqual(bigquery_query._CLIENT_CACHE, {})
+        self.assertEqual(bigquery_query._BQSTORAGE_CLIENT_CACHE, {})
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_keeps_clients_when_rate_limited(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure cached BigQuery clients are kept after a rate limiting 403."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        mock_client.query.side_effect = Forbidden(
+            "rate limited", errors=[{"reason": "rateLimitExceeded"}]
+        )
+
+        self.connector._pointer = "1738500089504000"
+        self.connector.run()
+
+        mock_client.close.assert_not_called()
+        self.assertEqual(len(bigquery_query._CLIENT_CACHE), 1)
+        self.assertEqual(len(bigquery_query._BQSTORAGE_CLIENT_CACHE), 1)
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_keeps_clients_when_permission_denied(
+        self, mock_get_creds, mock_bigquery_client
+    ):
+        """Ensure a gRPC permission error from the Storage Read API is reported, and
+        does not evict clients shared with other connectors."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+
+        # gRPC mapped errors carry the RpcError, rather than a dict, in their errors.
+        results = mock_row_iterator([])
+        results.to_arrow_iterable.side_effect = PermissionDenied(
+            "bigquery.readsessions.create denied", errors=(object(),)
+        )
+        mock_query_job.result.return_value = results
+
+        self.connector._pointer = "1738500089504000"
+
+        with self.assertRaises(RequestFailedException) as context:
+            self.connector.collect()
+
+        self.assertIn("bigquery.readsessions.create denied", str(context.exception))
+        self.assertEqual(len(bigquery_query._CLIENT_CACHE), 1)
+        self.assertEqual(len(bigquery_query._BQSTORAGE_CLIENT_CACHE), 1)
+
+    @patch('grove.connectors.google.bigquery_query.bigquery.Client')
+    @patch.object(Connector, 'get_credentials')
+    def test_collect_query_priority(self, mock_get_creds, mock_bigquery_client):
+        """Ensure queries run at batch priority unless configured otherwise."""
+        mock_get_creds.return_value = Mock()
+
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+
+        mock_query_job = Mock()
+        mock_client.query.return_value = mock_query_job
+        mock_query_job.result.return_value = mock_row_iterator([])
+
+        self.connector._pointer = "1738500089504000"
+        self.connector.run()
+
+        job_config = mock_client.query.call_args.kwargs["job_config"]
+        self.assertEqual(job_config.priority, "BATCH")
+
+        self.connector.configuration.query_priority = "interactive"
+        self.connector.run()
+
+        job_config = mock_client.query.call_args.kwargs["job_config"]
+        self.assertEqual(job_config.priority, "INTERACTIVE")
+
+    def test_configuration_validation_query_priority(self):
+        """Test that an unknown query_priority raises ConfigurationException."""
+        self.connector.configuration.query_priority = "urgent"
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("query_priority must be either", str(context.exception))
+
+    def test_configuration_validation_use_storage_api(self):
+        """Test that non-boolean use_storage_api raises ConfigurationException."""
+        self.connector.configuration.use_storage_api = "yes"
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("use_storage_api must be a boolean", str(context.exception))
+
+    def test_configuration_validation_partition_column(self):
+        """Test that an invalid partition_column raises ConfigurationException."""
+        self.connector.configuration.partition_column = "_PARTITIONDATE; DROP TABLE x"
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("is not a valid field path", str(context.exception))
+
+    def test_configuration_validation_partition_column_type(self):
+        """Test that an unknown partition_column_type raises ConfigurationException."""
+        self.connector.configuration.partition_column_type = "INT64"
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("partition_column_type must be one of", str(context.exception))
+
+    def test_configuration_validation_max_query_rows(self):
+        """Test that a non-positive max_query_rows raises ConfigurationException."""
+        self.connector.configuration.max_query_rows = 0
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("max_query_rows must be a positive integer", str(context.exception))
+
+    def test_configuration_validation_max_stream_count(self):
+        """Test that a non-positive max_stream_count raises ConfigurationException."""
+        self.connector.configuration.max_stream_count = 0
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn(
+            "max_stream_count must be a positive integer", str(context.exception)
+        )
+
+        # Multiple streams can only be read using the Storage Read API.
+        self.connector.configuration.max_stream_count = 2
+        self.connector.configuration.use_storage_api = False
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("requires use_storage_api", str(context.exception))
+
     def test_compute_lookback_days_bootstrap(self):
         """Test lookback computation for new connectors."""
         now_utc = datetime(2024, 1, 8, 12, 0, 0, tzinfo=timezone.utc)
@@ -723,6 +1386,17 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         expected = int(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp() * 1_000_000)
         self.assertEqual(watermark, expected)
 
+    def test_initialize_watermark_timestamp_microseconds(self):
+        """Test watermark initialization from a full precision timestamp pointer."""
+        self.connector.pointer = "2024-01-01 00:00:00.700000+00:00"
+
+        watermark = self.connector._initialize_watermark("timestamp")
+        expected = int(
+            datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp() * 1_000_000
+        )
+        self.assertEqual(watermark, expected + 700000)
+        self.assertEqual(self.connector.pointer, "2024-01-01 00:00:00.700000+00:00")
+
     def test_initialize_watermark_no_pointer(self):
         """Test watermark initialization when no pointer exists."""
         self.connector.pointer = None
@@ -735,109 +1409,138 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         # Allow for small time differences
         self.assertAlmostEqual(watermark, week_ago, delta=1000000)
 
-    def test_fetch_page_bigquery_parameters(self):
+    def test_build_query_partition_column(self):
+        """Test that partitions are pruned using the configured partition column."""
+        args = (
+            "test-project", "test_dataset", "test_table", ["created_at"], "created_at",
+            "timestamp",
+        )
+
+        query = self.connector._build_query(*args)
+        self.assertIn("WHERE _PARTITIONDATE >= @min_partition_date", query)
+
+        query = self.connector._build_query(*args, "_PARTITIONTIME")
+        self.assertIn("WHERE _PARTITIONTIME >= TIMESTAMP(@min_partition_date)", query)
+
+        query = self.connector._build_query(*args, "created_at")
+        self.assertIn("WHERE created_at >= TIMESTAMP(@min_partition_date)", query)
+
+        # DATE and DATETIME partitioning columns are compared using their own type.
+        query = self.connector._build_query(*args, "event_date", "DATE")
+        self.assertIn("WHERE event_date >= @min_partition_date", query)
+
+        query = self.connector._build_query(*args, "event_datetime", "DATETIME")
+        self.assertIn(
+            "WHERE event_datetime >= DATETIME(@min_partition_date)", query
+        )
+
+        # An empty partition column disables partition pruning, for tables which are
+        # not partitioned.
+        query = self.connector._build_query(*args, "")
+        self.assertNotIn("min_partition_date", query)
+        self.assertIn("WHERE created_at >= TIMESTAMP_MICROS(@low_watermark)", query)
+
+    def test_submit_query_parameters(self):
         """Test that query parameters are correctly set."""
         mock_client = Mock()
         mock_query_job = Mock()
-        mock_results = Mock()
-        
         # Mock the query execution
         mock_client.query.return_value = mock_query_job
-        mock_query_job.result.return_value = mock_results
-        mock_results.__iter__ = lambda self: iter([])
-        
-        # Mock job attributes
-        mock_query_job.total_bytes_processed = 1048576
-        mock_query_job.slot_millis = 1500
         
         with patch('grove.connectors.google.bigquery_query.bigquery.QueryJobConfig') as mock_config_class:
             mock_config = Mock()
             mock_config_class.return_value = mock_config
             
-            self.connector._fetch_page_bigquery(
+            query_job = self.connector._submit_query(
                 client=mock_client,
+                query=self.connector._build_query(
+                    "test-project",
+                    "test_dataset",
+                    "test_table",
+                    ["gmail.event_info.timestamp_usec", "gmail"],
+                    "gmail.event_info.timestamp_usec",
+                ),
                 project_id="test-project",
-                dataset_name="test_dataset",
-                table_name="test_table",
-                columns=["gmail.event_info.timestamp_usec", "gmail"],
-                pointer_path="gmail.event_info.timestamp_usec",
-                time_format="microseconds",
                 last_seen_usec=1704067200000000,
-                page_size=5000,
+                row_limit=5000,
                 min_partition_date=datetime(2024, 1, 1).date(),
                 ceiling_usec=1704153600000000
             )
             
             # Verify QueryJobConfig was called with correct parameters
             mock_config_class.assert_called_once()
+            self.assertEqual(query_job, mock_query_job)
 
-    def test_fetch_page_bigquery_with_results(self):
-        """Test fetching page with actual results."""
-        mock_client = Mock()
+    def test_read_pages_with_results(self):
+        """Test reading pages with actual results."""
         mock_query_job = Mock()
         
         # Mock results with timestamp data - use nested structure to match pointer_path
         mock_row1 = {"gmail": {"event_info": {"timestamp_usec": 1704067200000000}, "data": "test1"}}
         mock_row2 = {"gmail": {"event_info": {"timestamp_usec": 1704067201000000}, "data": "test2"}}
-        mock_results = [mock_row1, mock_row2]
-        
-        mock_query_job.result.return_value = mock_results
+        mock_row3 = {"gmail": {"event_info": {"timestamp_usec": 1704067202000000}, "data": "test3"}}
+        mock_query_job.result.return_value = mock_row_iterator(
+            [mock_row1, mock_row2, mock_row3]
+        )
         mock_query_job.total_bytes_processed = 1048576
         mock_query_job.slot_millis = 1500
         
-        mock_client.query.return_value = mock_query_job
-        
-        with patch('grove.connectors.google.bigquery_query.bigquery.QueryJobConfig'):
-            rows, new_watermark, debug_metadata = self.connector._fetch_page_bigquery(
-                client=mock_client,
+        pages = list(
+            self.connector._read_pages(
+                query_job=mock_query_job,
                 project_id="test-project",
-                dataset_name="test_dataset",
-                table_name="test_table",
-                columns=["gmail.event_info.timestamp_usec", "gmail"],
-                pointer_path="gmail.event_info.timestamp_usec",
-                time_format="microseconds",
-                last_seen_usec=1704067200000000,
-                page_size=5000,
+                page_size=2,
                 min_partition_date=datetime(2024, 1, 1).date(),
                 ceiling_usec=1704153600000000
             )
-            
-            self.assertEqual(len(rows), 2)
-            self.assertEqual(new_watermark, 1704067201000000)
-            self.assertEqual(debug_metadata["rows_returned"], 2)
-            self.assertEqual(debug_metadata["new_watermark"], 1704067201000000)
+        )
 
-    def test_fetch_page_bigquery_nested_pointer_path(self):
-        """Test fetching page with nested pointer path."""
-        mock_client = Mock()
+        self.assertEqual(pages, [[mock_row1, mock_row2], [mock_row3]])
+        new_watermark = self.connector._extract_watermark(
+            pages[0][-1], "gmail.event_info.timestamp_usec", "microseconds", None
+        )
+        self.assertEqual(new_watermark, 1704067201000000)
+
+    def test_read_pages_across_record_batches(self):
+        """Test that pages are assembled from rows spanning multiple record batches."""
         mock_query_job = Mock()
-        
-        # Mock results with nested timestamp data
-        mock_row = {"gmail": {"event_info": {"timestamp_usec": 1704067200000000}}}
-        mock_results = [mock_row]
-        
-        mock_query_job.result.return_value = mock_results
-        mock_query_job.total_bytes_processed = 1048576
-        mock_query_job.slot_millis = 1500
-        
-        mock_client.query.return_value = mock_query_job
-        
-        with patch('grove.connectors.google.bigquery_query.bigquery.QueryJobConfig'):
-            rows, new_watermark, debug_metadata = self.connector._fetch_page_bigquery(
-                client=mock_client,
+        rows = [{"timestamp_usec": i, "message": f"log {i}"} for i in range(7)]
+        mock_query_job.result.return_value = mock_row_iterator(rows, batch_size=2)
+
+        pages = list(
+            self.connector._read_pages(
+                query_job=mock_query_job,
                 project_id="test-project",
-                dataset_name="test_dataset",
-                table_name="test_table",
-                columns=["gmail"],
-                pointer_path="gmail.event_info.timestamp_usec",
-                time_format="microseconds",
-                last_seen_usec=1704067200000000,
-                page_size=5000,
+                page_size=3,
                 min_partition_date=datetime(2024, 1, 1).date(),
                 ceiling_usec=1704153600000000
             )
-            
-            self.assertEqual(new_watermark, 1704067200000000)
+        )
+
+        self.assertEqual(pages, [rows[0:3], rows[3:6], rows[6:7]])
+
+    def test_extract_watermark_nested_pointer_path(self):
+        """Test extracting the watermark with nested pointer path."""
+        mock_row = {"gmail": {"event_info": {"timestamp_usec": 1704067200000000}}}
+
+        new_watermark = self.connector._extract_watermark(
+            mock_row, "gmail.event_info.timestamp_usec", "microseconds", None
+        )
+
+        self.assertEqual(new_watermark, 1704067200000000)
+
+    def test_extract_watermark_datetime_pointer(self):
+        """Test extracting the watermark where the pointer is a native TIMESTAMP value."""
+        last = datetime(2024, 1, 1, 0, 0, 1, 123456, tzinfo=timezone.utc)
+
+        new_watermark = self.connector._extract_watermark(
+            {"created_at": last, "message": "test"},
+            "created_at",
+            "timestamp",
+            1704067200000000,
+        )
+
+        self.assertEqual(new_watermark, 1704067201123456)
 
     def test_configuration_validation_page_size(self):
         """Test that invalid page_size raises ConfigurationException."""
@@ -857,6 +1560,33 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
         
         self.assertIn("page_size must be a positive integer", str(context.exception))
 
+    def test_configuration_validation_pointer_path(self):
+        """Test that a pointer_path which is not a field path is rejected."""
+        self.connector.configuration.pointer_path = "ts > 0; DROP TABLE x; --"
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("is not a valid field path", str(context.exception))
+
+    def test_configuration_validation_columns(self):
+        """Test that columns which are not field paths are rejected."""
+        self.connector.configuration.columns = ["message", "(SELECT 1)"]
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("must be '*' or a valid field path", str(context.exception))
+
+    def test_configuration_validation_table_name(self):
+        """Test that a table name which would escape quoting is rejected."""
+        self.connector.configuration.table_name = "test_table` WHERE 1=1 --"
+
+        with self.assertRaises(ConfigurationException) as context:
+            self.connector.collect()
+
+        self.assertIn("table_name", str(context.exception))
+
     def test_create_bigquery_client_success(self):
         """Test successful BigQuery client creation."""
         with patch('grove.connectors.google.bigquery_query.bigquery.Client') as mock_client_class:
@@ -916,6 +1646,23 @@ class GoogleBigQueryQueryTestCase(unittest.TestCase):
             credentials = self.connector.get_credentials()
             self.assertEqual(credentials, mock_creds)
 
+    def test_get_credentials_cached(self):
+        """Test credentials are only generated once for the same service account."""
+        with patch('grove.connectors.google.bigquery_query.service_account.Credentials') as mock_creds_class:
+            mock_creds = Mock()
+            mock_creds_class.from_service_account_info.return_value = mock_creds
+
+            self.assertEqual(self.connector.get_credentials(), mock_creds)
+            self.assertEqual(self.connector.get_credentials(), mock_creds)
+            mock_creds_class.from_service_account_info.assert_called_once()
+
+            # A different service account must not reuse these credentials.
+            self.connector.key = '{"client_email": "other"}'
+            self.connector.get_credentials()
+            self.assertEqual(
+                mock_creds_class.from_service_account_info.call_count, 2
+            )
+
     def test_get_credentials_invalid_json(self):
         """Test credentials generation fails with invalid JSON."""
         self.connector.key = "invalid json"